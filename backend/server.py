@@ -1,15 +1,16 @@
-from fastapi import FastAPI, APIRouter, UploadFile, File, HTTPException
+from fastapi import FastAPI, APIRouter, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 import PyPDF2
 import io
@@ -34,6 +35,14 @@ api_router = APIRouter(prefix="/api")
 # Initialize Emergent LLM Key
 EMERGENT_KEY = os.getenv("EMERGENT_LLM_KEY", "")
 
+LEGAL_SYSTEM_MESSAGE = "You are a knowledgeable Philippine legal assistant. Provide accurate, helpful legal information while clearly stating you are not providing legal advice. Reference relevant Philippine laws when applicable. Be professional and clear."
+
+# Chat history settings
+CHAT_SUMMARY_INTERVAL = 10  # Messages per rolling summary window
+CHAT_SUMMARY_BATCH = CHAT_SUMMARY_INTERVAL * 2  # Max messages folded in per summary run
+CHAT_SUMMARY_CLAIM_TIMEOUT = timedelta(minutes=5)  # Stale in-flight summary claims are retaken
+CHAT_HISTORY_HEAVY_FIELDS = ["context"]
+
 # ==================== MODELS ====================
 
 class TranslationRequest(BaseModel):
@@ -104,6 +113,103 @@ def detect_language_simple(text: str) -> str:
     except:
         return "unknown"
 
+def format_chat_turns(records: List[dict]) -> str:
+    """Render stored chat records as a plain-text transcript"""
+    return "\n\n".join(
+        f"User: {r['user_message']}\nAssistant: {r['assistant_response']}" for r in records
+    )
+
+async def summarize_chat_session(session_id: str):
+    """Fold the next batch of unsummarized chat messages into the session's rolling summary"""
+    now = datetime.now(timezone.utc)
+    try:
+        # Claim the session so concurrent triggers don't repeat the same LLM call
+        claim = await db.chat_sessions.update_one(
+            {"session_id": session_id, "$or": [
+                {"summarizing_since": {"$exists": False}},
+                {"summarizing_since": {"$lt": (now - CHAT_SUMMARY_CLAIM_TIMEOUT).isoformat()}}
+            ]},
+            {"$set": {"summarizing_since": now.isoformat()}}
+        )
+        if claim.modified_count == 0:
+            return
+    except Exception as e:
+        logger.warning(f"Chat summary claim failed for session {session_id}: {e}")
+        return
+
+    try:
+        existing = await db.chat_summaries.find_one(
+            {"session_id": session_id},
+            {"_id": 0, "summary": 1, "message_count": 1}
+        )
+        summarized = existing["message_count"] if existing else 0
+        pending = await db.chat_history.find(
+            {"session_id": session_id},
+            {"_id": 0, "user_message": 1, "assistant_response": 1}
+        ).sort("created_at", 1).skip(summarized).limit(CHAT_SUMMARY_BATCH).to_list(CHAT_SUMMARY_BATCH)
+        if not pending:
+            return
+
+        previous_summary = existing["summary"] if existing else "None"
+        chat = LlmChat(
+            api_key=EMERGENT_KEY,
+            session_id=f"{session_id}-summary",
+            system_message="You summarize Philippine legal assistance conversations. Keep the legal issues, facts given by the user, laws cited and conclusions reached. Be concise."
+        ).with_model("anthropic", "claude-sonnet-4-20250514")
+        summary = await chat.send_message(UserMessage(
+            text=f"Previous summary: {previous_summary}\n\nNew messages:\n{format_chat_turns(pending)}\n\nWrite an updated summary of the whole conversation."
+        ))
+
+        await db.chat_summaries.update_one(
+            {"session_id": session_id},
+            {"$set": {
+                "summary": summary,
+                "message_count": summarized + len(pending),
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }},
+            upsert=True
+        )
+    except Exception as e:
+        logger.warning(f"Chat summary failed for session {session_id}: {e}")
+    finally:
+        await db.chat_sessions.update_one(
+            {"session_id": session_id, "summarizing_since": now.isoformat()},
+            {"$unset": {"summarizing_since": ""}}
+        )
+
+async def ensure_chat_indexes():
+    """Create indexes backing chat history reads and session listing"""
+    await db.chat_history.create_index([("session_id", 1), ("created_at", 1), ("id", 1)])
+    await db.chat_summaries.create_index("session_id", unique=True)
+    await db.chat_sessions.create_index("session_id", unique=True)
+    await db.chat_sessions.create_index([("last_activity", -1), ("session_id", -1)])
+
+async def initialize_chat_sessions():
+    """Backfill the per-session roll-up from existing chat history"""
+    count = await db.chat_sessions.count_documents({})
+    if count > 0:
+        return
+
+    await db.chat_history.aggregate([
+        {"$sort": {"session_id": 1, "created_at": 1}},
+        {"$group": {
+            "_id": "$session_id",
+            "message_count": {"$sum": 1},
+            "first_question": {"$first": "$user_message"},
+            "started_at": {"$first": "$created_at"},
+            "last_activity": {"$last": "$created_at"}
+        }},
+        {"$project": {
+            "_id": 0,
+            "session_id": "$_id",
+            "message_count": 1,
+            "first_question": 1,
+            "started_at": 1,
+            "last_activity": 1
+        }},
+        {"$merge": {"into": "chat_sessions", "on": "session_id", "whenMatched": "keepExisting"}}
+    ]).to_list(None)
+
 async def initialize_legal_knowledge():
     """Initialize mock Philippine legal database"""
     count = await db.legal_knowledge.count_documents({})
@@ -297,7 +403,7 @@ async def get_document(document_id: str):
 
 # Legal Chat with Claude Sonnet
 @api_router.post("/chat", response_model=ChatResponse)
-async def legal_chat(request: ChatRequest):
+async def legal_chat(request: ChatRequest, background_tasks: BackgroundTasks):
     try:
         session_id = request.session_id or str(uuid.uuid4())
         
@@ -305,13 +411,33 @@ async def legal_chat(request: ChatRequest):
         chat = LlmChat(
             api_key=EMERGENT_KEY,
             session_id=session_id,
-            system_message="You are a knowledgeable Philippine legal assistant. Provide accurate, helpful legal information while clearly stating you are not providing legal advice. Reference relevant Philippine laws when applicable. Be professional and clear."
+            system_message=LEGAL_SYSTEM_MESSAGE
         ).with_model("anthropic", "claude-sonnet-4-20250514")
         
-        # Add context if provided
+        # Add rolling summary, the latest turns and context if available
         message_text = request.message
         if request.context:
             message_text = f"Context: {request.context}\n\nQuestion: {request.message}"
+        summarized = 0
+        if request.session_id:
+            summary = await db.chat_summaries.find_one(
+                {"session_id": session_id},
+                {"_id": 0, "summary": 1, "message_count": 1}
+            )
+            summarized = summary["message_count"] if summary else 0
+            # A fixed window keeps the prompt bounded even when summaries fall behind
+            recent = await db.chat_history.find(
+                {"session_id": session_id},
+                {"_id": 0, "user_message": 1, "assistant_response": 1}
+            ).sort("created_at", -1).limit(CHAT_SUMMARY_INTERVAL).to_list(CHAT_SUMMARY_INTERVAL)
+            recent.reverse()
+            history = []
+            if summary:
+                history.append(f"Conversation summary (may not cover the latest messages): {summary['summary']}")
+            if recent:
+                history.append(f"Recent messages:\n{format_chat_turns(recent)}")
+            if history:
+                message_text = "\n\n".join(history + [message_text])
         
         # Send message
         user_message = UserMessage(text=message_text)
@@ -328,6 +454,26 @@ async def legal_chat(request: ChatRequest):
         }
         await db.chat_history.insert_one(chat_record)
         
+        # Update the session roll-up; its message_count drives the summary trigger
+        session = await db.chat_sessions.find_one_and_update(
+            {"session_id": session_id},
+            {
+                "$inc": {"message_count": 1},
+                "$setOnInsert": {
+                    "first_question": request.message,
+                    "started_at": chat_record["created_at"]
+                },
+                "$max": {"last_activity": chat_record["created_at"]}
+            },
+            projection={"_id": 0, "message_count": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        
+        # Refresh rolling summary off the request path once enough messages are unsummarized
+        if session["message_count"] - summarized >= CHAT_SUMMARY_INTERVAL:
+            background_tasks.add_task(summarize_chat_session, session_id)
+        
         return ChatResponse(
             response=response,
             session_id=session_id
@@ -335,15 +481,85 @@ async def legal_chat(request: ChatRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# List Chat Sessions
+@api_router.get("/chat/sessions")
+async def list_chat_sessions(limit: int = 20, before: Optional[str] = None, before_id: Optional[str] = None):
+    try:
+        limit = max(1, min(limit, 100))
+        # Keyset pagination on (last_activity, session_id) from the previous page's next_cursor
+        query = {}
+        if before:
+            if before_id:
+                query["$or"] = [
+                    {"last_activity": {"$lt": before}},
+                    {"last_activity": before, "session_id": {"$lt": before_id}}
+                ]
+            else:
+                query["last_activity"] = {"$lt": before}
+        sessions = await db.chat_sessions.find(
+            query,
+            {"_id": 0, "summarizing_since": 0}
+        ).sort([("last_activity", -1), ("session_id", -1)]).limit(limit + 1).to_list(limit + 1)
+        
+        # The extra row only signals that another page exists
+        next_cursor = None
+        if len(sessions) > limit:
+            sessions = sessions[:limit]
+            last = sessions[-1]
+            next_cursor = {"before": last["last_activity"], "before_id": last["session_id"]}
+        return {"sessions": sessions, "next_cursor": next_cursor}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # Get Chat History
 @api_router.get("/chat/sessions/{session_id}")
-async def get_chat_history(session_id: str):
+async def get_chat_history(
+    session_id: str,
+    include_context: bool = False,
+    limit: int = 100,
+    after: Optional[str] = None,
+    after_id: Optional[str] = None
+):
     try:
+        limit = max(1, min(limit, 100))
+        projection = {"_id": 0}
+        if not include_context:
+            projection.update({field: 0 for field in CHAT_HISTORY_HEAVY_FIELDS})
+        # Keyset pagination on (created_at, id) from the previous page's next_cursor
+        query = {"session_id": session_id}
+        if after:
+            if after_id:
+                query["$or"] = [
+                    {"created_at": {"$gt": after}},
+                    {"created_at": after, "id": {"$gt": after_id}}
+                ]
+            else:
+                query["created_at"] = {"$gt": after}
         messages = await db.chat_history.find(
-            {"session_id": session_id},
-            {"_id": 0}
-        ).sort("created_at", 1).to_list(100)
-        return {"messages": messages}
+            query,
+            projection
+        ).sort([("created_at", 1), ("id", 1)]).limit(limit + 1).to_list(limit + 1)
+        
+        next_cursor = None
+        if len(messages) > limit:
+            messages = messages[:limit]
+            last = messages[-1]
+            next_cursor = {"after": last["created_at"], "after_id": last["id"]}
+        summary = await db.chat_summaries.find_one({"session_id": session_id}, {"_id": 0})
+        return {"messages": messages, "summary": summary, "next_cursor": next_cursor}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Get Chat Session Summary
+@api_router.get("/chat/sessions/{session_id}/summary")
+async def get_chat_summary(session_id: str):
+    try:
+        summary = await db.chat_summaries.find_one({"session_id": session_id}, {"_id": 0})
+        if not summary:
+            raise HTTPException(status_code=404, detail="Summary not found")
+        return summary
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -407,6 +623,8 @@ logger = logging.getLogger(__name__)
 @app.on_event("startup")
 async def startup_event():
     await initialize_legal_knowledge()
+    await ensure_chat_indexes()
+    await initialize_chat_sessions()
     logger.info("Miriam API Started")
 
 @app.on_event("shutdown")
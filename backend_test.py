@@ -48,6 +48,16 @@ class BatasAIAPITester:
             print(f"❌ Failed - Error: {str(e)}")
             return False, {}
 
+    def check(self, name, condition):
+        """Record a single assertion on a response body"""
+        self.tests_run += 1
+        if condition:
+            self.tests_passed += 1
+            print(f"✅ Passed - {name}")
+        else:
+            print(f"❌ Failed - {name}")
+        return condition
+
     def test_root_endpoint(self):
         """Test root API endpoint"""
         return self.run_test("Root API", "GET", "", 200)
@@ -169,6 +179,88 @@ class BatasAIAPITester:
         if success and isinstance(response, dict) and 'messages' in response:
             messages_count = len(response['messages'])
             print(f"   💬 Found {messages_count} messages in chat history")
+            success = self.check("History includes summary key", 'summary' in response) and success
+            success = self.check("History includes next_cursor key", 'next_cursor' in response) and success
+            success = self.check(
+                "History omits context by default",
+                messages_count > 0 and all('context' not in m for m in response['messages'])
+            ) and success
+
+        ctx_success, ctx_response = self.run_test(
+            "Get Chat History With Context", "GET",
+            f"chat/sessions/{self.session_id}?include_context=true", 200
+        )
+        if ctx_success and isinstance(ctx_response, dict) and 'messages' in ctx_response:
+            ctx_success = self.check(
+                "History includes context when requested",
+                len(ctx_response['messages']) > 0 and all('context' in m for m in ctx_response['messages'])
+            )
+        return success and ctx_success
+
+    def test_chat_history_pagination(self):
+        """Test chat history keyset pagination"""
+        if not self.session_id:
+            print("   ⚠️  Skipping chat history pagination test - no session ID")
+            return True
+
+        success, response = self.run_test(
+            "Get Chat History Page 1", "GET", f"chat/sessions/{self.session_id}?limit=1", 200
+        )
+        if not success or not isinstance(response, dict):
+            return success
+        cursor = response.get('next_cursor')
+        if not self.check("History page 1 has next_cursor", bool(cursor)):
+            return False
+
+        endpoint = (
+            f"chat/sessions/{self.session_id}?limit=1"
+            f"&after={requests.utils.quote(cursor['after'])}&after_id={cursor['after_id']}"
+        )
+        success, next_page = self.run_test("Get Chat History Page 2", "GET", endpoint, 200)
+        if success and isinstance(next_page, dict):
+            first_id = response['messages'][0]['id']
+            success = self.check(
+                "Next history page returns a different message",
+                len(next_page.get('messages', [])) == 1 and next_page['messages'][0]['id'] != first_id
+            )
+        return success
+
+    def test_chat_summary_not_found(self):
+        """Test summary lookup for an unknown session"""
+        success, _ = self.run_test("Get Unknown Chat Summary", "GET", "chat/sessions/no-such-session/summary", 404)
+        return success
+
+    def test_chat_sessions_listing(self):
+        """Test chat sessions listing"""
+        success, response = self.run_test("List Chat Sessions", "GET", "chat/sessions?limit=5", 200)
+        if success and isinstance(response, dict) and 'sessions' in response:
+            sessions_count = len(response['sessions'])
+            print(f"   🗂️  Found {sessions_count} chat sessions")
+            expected_keys = ['session_id', 'message_count', 'first_question', 'last_activity']
+            success = self.check(
+                "Listed sessions have expected keys",
+                sessions_count > 0 and all(all(key in s for key in expected_keys) for s in response['sessions'])
+            )
+        return success
+
+    def test_chat_sessions_pagination(self):
+        """Test chat sessions keyset pagination"""
+        success, response = self.run_test("List Chat Sessions Page 1", "GET", "chat/sessions?limit=1", 200)
+        if not success or not isinstance(response, dict):
+            return success
+        cursor = response.get('next_cursor')
+        if not cursor:
+            print("   ⚠️  Skipping pagination test - only one chat session")
+            return True
+
+        endpoint = f"chat/sessions?limit=1&before={requests.utils.quote(cursor['before'])}&before_id={cursor['before_id']}"
+        success, next_page = self.run_test("List Chat Sessions Page 2", "GET", endpoint, 200)
+        if success and isinstance(next_page, dict):
+            first_id = response['sessions'][0]['session_id']
+            success = self.check(
+                "Next page returns a different session",
+                len(next_page.get('sessions', [])) == 1 and next_page['sessions'][0]['session_id'] != first_id
+            )
         return success
 
     def test_document_upload(self):
@@ -243,6 +335,10 @@ def main():
     tester.test_legal_chat()
     tester.test_chat_follow_up()
     tester.test_chat_history()
+    tester.test_chat_history_pagination()
+    tester.test_chat_sessions_listing()
+    tester.test_chat_sessions_pagination()
+    tester.test_chat_summary_not_found()
     
     # Print final results
     print("\n" + "=" * 60)
@@ -2,15 +2,22 @@ import React, { useState, useEffect } from 'react';
 import { useLanguage } from '../contexts/LanguageContext';
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from './ui/tabs';
+import { Button } from './ui/button';
 import { Languages, MessageSquare } from 'lucide-react';
 import apiClient from '../api/apiClient';
 
 export const History = () => {
   const { t } = useLanguage();
   const [translations, setTranslations] = useState([]);
+  const [sessions, setSessions] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [openSessionId, setOpenSessionId] = useState(null);
+  const [sessionMessages, setSessionMessages] = useState({});
+  const [messageCursors, setMessageCursors] = useState({});
 
   useEffect(() => {
     fetchTranslations();
+    fetchSessions();
   }, []);
 
   const fetchTranslations = async () => {
@@ -22,6 +29,43 @@ export const History = () => {
     }
   };
 
+  const fetchSessions = async (cursor = null) => {
+    try {
+      const response = await apiClient.get('/chat/sessions', { params: cursor || {} });
+      const page = response.data.sessions || [];
+      setSessions((prev) => (cursor ? [...prev, ...page] : page));
+      setNextCursor(response.data.next_cursor || null);
+    } catch (error) {
+      console.error('Error fetching chat sessions:', error);
+    }
+  };
+
+  const fetchSessionMessages = async (sessionId, cursor = null) => {
+    try {
+      const response = await apiClient.get(`/chat/sessions/${sessionId}`, { params: cursor || {} });
+      const page = response.data.messages || [];
+      // Keyed by session so a slow response never lands in another open session
+      setSessionMessages((prev) => ({
+        ...prev,
+        [sessionId]: cursor ? [...(prev[sessionId] || []), ...page] : page,
+      }));
+      setMessageCursors((prev) => ({ ...prev, [sessionId]: response.data.next_cursor || null }));
+    } catch (error) {
+      console.error('Error fetching chat history:', error);
+    }
+  };
+
+  const toggleSession = (sessionId) => {
+    if (openSessionId === sessionId) {
+      setOpenSessionId(null);
+      return;
+    }
+    setOpenSessionId(sessionId);
+    if (!sessionMessages[sessionId]) {
+      fetchSessionMessages(sessionId);
+    }
+  };
+
   return (
     <div className="space-y-6" data-testid="history-page">
       <div>
@@ -96,10 +140,68 @@ export const History = () => {
               <CardTitle className="font-serif">Chat History</CardTitle>
             </CardHeader>
             <CardContent>
-              <div className="text-center py-12">
-                <MessageSquare className="h-16 w-16 text-muted-foreground mx-auto mb-4" />
-                <p className="text-muted-foreground">Chat history available per session</p>
-              </div>
+              {sessions.length > 0 ? (
+                <div className="space-y-4">
+                  {sessions.map((session) => (
+                    <div
+                      key={session.session_id}
+                      className="p-4 rounded-sm border hover:bg-muted/50 transition-colors cursor-pointer"
+                      onClick={() => toggleSession(session.session_id)}
+                      data-testid="chat-session-item"
+                    >
+                      <div className="flex items-center justify-between mb-2">
+                        <span className="legal-badge">{session.message_count} messages</span>
+                        <span className="text-xs text-muted-foreground">
+                          {new Date(session.last_activity).toLocaleString()}
+                        </span>
+                      </div>
+                      <p className="text-sm line-clamp-2">{session.first_question}</p>
+                      {openSessionId === session.session_id && (
+                        <div
+                          className="space-y-3 mt-4 border-t pt-4"
+                          onClick={(e) => e.stopPropagation()}
+                          data-testid="chat-session-messages"
+                        >
+                          {(sessionMessages[session.session_id] || []).map((msg) => (
+                            <div key={msg.id}>
+                              <p className="text-xs text-muted-foreground mb-1">Question</p>
+                              <p className="text-sm mb-2">{msg.user_message}</p>
+                              <p className="text-xs text-muted-foreground mb-1">Answer</p>
+                              <p className="text-sm whitespace-pre-wrap">{msg.assistant_response}</p>
+                            </div>
+                          ))}
+                          {messageCursors[session.session_id] && (
+                            <Button
+                              variant="outline"
+                              size="sm"
+                              onClick={() => fetchSessionMessages(session.session_id, messageCursors[session.session_id])}
+                              data-testid="load-more-messages-btn"
+                            >
+                              Load more messages
+                            </Button>
+                          )}
+                        </div>
+                      )}
+                    </div>
+                  ))}
+                  {nextCursor && (
+                    <div className="text-center">
+                      <Button
+                        variant="outline"
+                        onClick={() => fetchSessions(nextCursor)}
+                        data-testid="load-more-sessions-btn"
+                      >
+                        Load more
+                      </Button>
+                    </div>
+                  )}
+                </div>
+              ) : (
+                <div className="text-center py-12">
+                  <MessageSquare className="h-16 w-16 text-muted-foreground mx-auto mb-4" />
+                  <p className="text-muted-foreground">No chat sessions yet</p>
+                </div>
+              )}
             </CardContent>
           </Card>
         </TabsContent>